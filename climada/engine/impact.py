@@ -857,8 +857,16 @@ class Impact():
         # get affected fractions
         fract = hazard.fraction[:, icens]
         # impact = fraction * mdr * value
-        inten_val.data = imp_fun.calc_mdr(inten_val.data)
-        impact = fract.multiply(inten_val).multiply(exposures.value.values[exp_iimp])
+        if np.array_equal(fract.indptr, inten_val.indptr) \
+        and np.array_equal(fract.indices, inten_val.indices):
+            # same sparsity pattern: compute impact in one pass over the stored values
+            impact = inten_val
+            impact.data = fract.data * imp_fun.calc_mdr(inten_val.data) \
+                * exposures.value.values[exp_iimp][inten_val.indices]
+            impact.eliminate_zeros()
+        else:
+            inten_val.data = imp_fun.calc_mdr(inten_val.data)
+            impact = fract.multiply(inten_val).multiply(exposures.value.values[exp_iimp])
 
         if insure_flag and impact.nonzero()[0].size:
             inten_val = hazard.intensity[:, icens].toarray()
@@ -22,7 +22,6 @@ Define DiscRates class.
 __all__ = ['DiscRates']
 
 import copy
-from array import array
 import logging
 import numpy as np
 import pandas as pd
@@ -116,7 +115,8 @@ class DiscRates():
 
     def append(self, disc_rates):
         """Check and append discount rates to current DiscRates. Overwrite
-        discount rate if same year.
+        discount rate if same year. If a year is repeated in disc_rates, its
+        last rate is used.
 
         Parameters:
             disc_rates (DiscRates): DiscRates instance to append
@@ -125,24 +125,30 @@ class DiscRates():
             ValueError
         """
         disc_rates.check()
+
+        # keep only the last rate of years repeated in disc_rates
+        _, pos_last = np.unique(disc_rates.years[::-1], return_index=True)
+        pos_last = np.sort(disc_rates.years.size - 1 - pos_last)
+        years_add = disc_rates.years[pos_last]
+        rates_add = disc_rates.rates[pos_last]
+
         if self.years.size == 0:
             self.__dict__ = copy.deepcopy(disc_rates.__dict__)
+            self.years = years_add
+            self.rates = rates_add
             return
 
         self.tag.append(disc_rates.tag)
 
-        new_year = array('l')
-        new_rate = array('d')
-        for year, rate in zip(disc_rates.years, disc_rates.rates):
-            found = np.where(year == self.years)[0]
-            if found.size > 0:
-                self.rates[found[0]] = rate
-            else:
-                new_year.append(year)
-                new_rate.append(rate)
-
-        self.years = np.append(self.years, new_year).astype(int, copy=False)
-        self.rates = np.append(self.rates, new_rate)
+        in_self = np.isin(years_add, self.years)
+        if np.any(in_self):
+            sort_idx = np.argsort(self.years, kind='stable')
+            pos_year = sort_idx[np.searchsorted(self.years, years_add[in_self],
+                                                sorter=sort_idx)]
+            self.rates[pos_year] = rates_add[in_self]
+
+        self.years = np.concatenate([self.years, years_add[~in_self]]).astype(int, copy=False)
+        self.rates = np.concatenate([self.rates, rates_add[~in_self]])
 
     def net_present_value(self, ini_year, end_year, val_years):
         """Compute net present value between present year and future year.
@@ -119,6 +119,59 @@ class TestAppend(unittest.TestCase):
         self.assertTrue(np.array_equal(disc_rate.tag.file_name, 'file1.txt + file2.txt'))
         self.assertTrue(np.array_equal(disc_rate.tag.description, 'descr1 + descr2'))
 
+    def test_append_unsorted_years(self):
+        """Append DiscRates whose years are not sorted. The rates with
+        repeated years are overwritten at their original position."""
+        disc_rate = DiscRates()
+        disc_rate.years = np.array([2002, 2000, 2001])
+        disc_rate.rates = np.array([0.3, 0.1, 0.2])
+
+        disc_rate_add = DiscRates()
+        disc_rate_add.years = np.array([2004, 2001, 2002])
+        disc_rate_add.rates = np.array([0.44, 0.22, 0.33])
+
+        disc_rate.append(disc_rate_add)
+        disc_rate.check()
+
+        self.assertTrue(np.array_equal(disc_rate.years,
+                                       np.array([2002, 2000, 2001, 2004])))
+        self.assertTrue(np.array_equal(disc_rate.rates,
+                                       np.array([0.33, 0.1, 0.22, 0.44])))
+
+    def test_append_repeated_years(self):
+        """Append DiscRates with repeated years. The last rate of each
+        repeated year is kept."""
+        disc_rate = DiscRates()
+        disc_rate.years = np.array([2000, 2001])
+        disc_rate.rates = np.array([0.1, 0.2])
+
+        disc_rate_add = DiscRates()
+        disc_rate_add.years = np.array([2003, 2001, 2003, 2001])
+        disc_rate_add.rates = np.array([0.3, 0.22, 0.33, 0.222])
+
+        disc_rate.append(disc_rate_add)
+        disc_rate.check()
+
+        self.assertTrue(np.array_equal(disc_rate.years,
+                                       np.array([2000, 2001, 2003])))
+        self.assertTrue(np.array_equal(disc_rate.rates,
+                                       np.array([0.1, 0.222, 0.33])))
+
+    def test_append_repeated_years_empty(self):
+        """Append DiscRates with repeated years to an empty DiscRates. The
+        last rate of each repeated year is kept."""
+        disc_rate = DiscRates()
+
+        disc_rate_add = DiscRates()
+        disc_rate_add.years = np.array([2003, 2001, 2003])
+        disc_rate_add.rates = np.array([0.3, 0.2, 0.33])
+
+        disc_rate.append(disc_rate_add)
+        disc_rate.check()
+
+        self.assertTrue(np.array_equal(disc_rate.years, np.array([2001, 2003])))
+        self.assertTrue(np.array_equal(disc_rate.rates, np.array([0.2, 0.33])))
+
 class TestSelect(unittest.TestCase):
     """Test select method"""
     def test_select_pass(self):
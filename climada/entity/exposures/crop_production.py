@@ -122,7 +122,7 @@ class CropProduction(Exposures):
     def set_from_single_run(self, input_dir=INPUT_DIR, filename=None, hist_mean=HIST_MEAN_PATH,
                             bbox=BBOX, yearrange=(YEARCHUNKS['histsoc'])['yearrange'],
                             cl_model=None, scenario='histsoc', crop=None, irr=None,
-                            unit='USD', fn_str_var=FN_STR_VAR):
+                            unit='USD', fn_str_var=FN_STR_VAR, dtype=None):
 
         """Wrapper to fill exposure from nc_dis file from ISIMIP
         Parameters:
@@ -146,6 +146,8 @@ class CropProduction(Exposures):
                 f.i 'USD' or 't'
             fn_str_var (string): FileName STRing depending on VARiable and
                 ISIMIP simuation round
+            dtype (numpy dtype, optional): data type of the exposure value, f.i.
+                np.float32 to halve its memory. Default: float64
 
         Returns:
             Exposure
@@ -178,43 +180,46 @@ class CropProduction(Exposures):
             yearchunk = YEARCHUNKS[scenario]
             filename = os.path.join(input_dir, filename)
 
-        # Dataset is opened and data within the bbox extends is extracted
-        data_set = xr.open_dataset(filename, decode_times=False)
-        [lonmin, latmin, lonmax, latmax] = bbox
-        data = data_set.sel(lon=slice(lonmin, lonmax), lat=slice(latmax, latmin))
-
-        # The latitude and longitude are set; the region_id is determined
-        lon, lat = np.meshgrid(data.lon.values, data.lat.values)
-        self['latitude'] = lat.flatten()
-        self['longitude'] = lon.flatten()
-        self['region_id'] = coord.get_country_code(self.latitude, self.longitude)
-
         # The indeces of the yearrange to be extracted are determined
         time_idx = np.array([int(yearrange[0] - yearchunk['startyear']),
                              int(yearrange[1] - yearchunk['startyear'])])
 
-        # The area covered by a grid cell is calculated depending on the latitude
-        # 1 degree = 111.12km (at the equator); resolution data: 0.5 degree;
-        # longitudal distance in km = 111.12*0.5*cos(lat);
-        # latitudal distance in km = 111.12*0.5;
-        # area = longitudal distance * latitudal distance;
-        # 1km2 = 100ha
-        area = (111.12 * 0.5)**2 * np.cos(np.deg2rad(lat)) * 100
-
-        # The area covered by a crop is calculated as the product of the fraction and
-        # the grid cell size
         if irr == 'combined':
             irr = ['irr', 'noirr']
         else:
             irr = [irr]
-        area_crop = dict()
-        for irr_var in irr:
-            area_crop[irr_var] = (
-                getattr(
-                    data, (CROP_NAME[crop])['input']+'_'+ (IRR_NAME[irr_var])['name']
-                )[time_idx[0]:time_idx[1], :, :].mean(dim='time')*area
-            ).values
-            area_crop[irr_var] = np.nan_to_num(area_crop[irr_var]).flatten()
+
+        # Dataset is opened lazily in dask chunks and only data within the bbox extends
+        # is extracted and loaded; the file is closed as soon as the values are read
+        [lonmin, latmin, lonmax, latmax] = bbox
+        with xr.open_dataset(filename, decode_times=False,
+                             chunks={'time': -1, 'lat': 64, 'lon': 64}) as data_set:
+            data = data_set.sel(lon=slice(lonmin, lonmax), lat=slice(latmax, latmin))
+            lon, lat = np.meshgrid(data.lon.values, data.lat.values)
+
+            # The area covered by a grid cell is calculated depending on the latitude
+            # 1 degree = 111.12km (at the equator); resolution data: 0.5 degree;
+            # longitudal distance in km = 111.12*0.5*cos(lat);
+            # latitudal distance in km = 111.12*0.5;
+            # area = longitudal distance * latitudal distance;
+            # 1km2 = 100ha
+            area = (111.12 * 0.5)**2 * np.cos(np.deg2rad(lat)) * 100
+
+            # The area covered by a crop is calculated as the product of the fraction and
+            # the grid cell size
+            area_crop = dict()
+            for irr_var in irr:
+                area_crop[irr_var] = (
+                    getattr(
+                        data, (CROP_NAME[crop])['input']+'_'+ (IRR_NAME[irr_var])['name']
+                    )[time_idx[0]:time_idx[1], :, :].mean(dim='time')*area
+                ).values
+                area_crop[irr_var] = np.nan_to_num(area_crop[irr_var]).flatten()
+
+        # The latitude and longitude are set; the region_id is determined
+        self['latitude'] = lat.flatten()
+        self['longitude'] = lon.flatten()
+        self['region_id'] = coord.get_country_code(self.latitude, self.longitude)
 
         # set historic mean, its latitude, and longitude:
         hist_mean_dict = dict()
@@ -225,18 +230,19 @@ class CropProduction(Exposures):
                 filename = os.path.join(hist_mean, 'hist_mean_%s-%s_%i-%i.hdf5' %(\
                                         crop, irr_var, yearrange[0], yearrange[1])
                                         )
-                hist_mean_dict[irr_var] = (h5py.File(filename, 'r'))['mean'][()]
-            lat_mean = (h5py.File(filename, 'r'))['lat'][()]
-            lon_mean = (h5py.File(filename, 'r'))['lon'][()]
+                with h5py.File(filename, 'r') as hist_mean_file:
+                    hist_mean_dict[irr_var] = hist_mean_file['mean'][()]
+                    lat_mean = hist_mean_file['lat'][()]
+                    lon_mean = hist_mean_file['lon'][()]
         elif isfile(os.path.join(input_dir, hist_mean)):
         # Hist_mean, lat_mean and lon_mean are extracted from the given file
             if len(irr) > 1:
                 LOGGER.error('For irr=combined, hist_mean can not be single file. Aborting.')
                 raise ValueError('Wrong combination of parameters irr and hist_mean.')
-            hist_mean = h5py.File(os.path.join(input_dir, hist_mean), 'r')
-            hist_mean_dict[irr[0]] = hist_mean['mean'][()]
-            lat_mean = hist_mean['lat'][()]
-            lon_mean = hist_mean['lon'][()]
+            with h5py.File(os.path.join(input_dir, hist_mean), 'r') as hist_mean_file:
+                hist_mean_dict[irr[0]] = hist_mean_file['mean'][()]
+                lat_mean = hist_mean_file['lat'][()]
+                lon_mean = hist_mean_file['lon'][()]
         else:
         # hist_mean as returned by the hazard crop_potential is used (array format) with same
         # bbox extensions as the exposure
@@ -289,6 +295,8 @@ class CropProduction(Exposures):
         # Method set_to_usd() is called to compute the exposure in USD/y (per centroid)
         if 'USD' in unit:
             self.set_to_usd(input_dir=input_dir)
+        if dtype is not None:
+            self['value'] = self.value.values.astype(dtype, copy=False)
         self.check()
 
         return self
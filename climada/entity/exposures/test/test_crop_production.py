@@ -44,6 +44,22 @@ class TestCropProduction(unittest.TestCase):
         self.assertEqual(exp.crop, 'mai')
         self.assertAlmostEqual(exp.value.max(), 284244.81023404596, places=5)
 
+    def test_load_dtype_pass(self):
+        """Test defining crop_production Exposure with float32 values"""
+        exp = CropProduction()
+        exp.set_from_single_run(input_dir=INPUT_DIR, filename=FILENAME, hist_mean=FILENAME_MEAN,
+                                bbox=[-5, 42, 16, 55], yearrange=np.array([2001, 2005]),
+                                scenario='flexible', unit='t', crop='mai', irr='firr')
+        exp_32 = CropProduction()
+        exp_32.set_from_single_run(input_dir=INPUT_DIR, filename=FILENAME, hist_mean=FILENAME_MEAN,
+                                   bbox=[-5, 42, 16, 55], yearrange=np.array([2001, 2005]),
+                                   scenario='flexible', unit='t', crop='mai', irr='firr',
+                                   dtype=np.float32)
+
+        self.assertEqual(exp_32.value.dtype, np.float32)
+        self.assertEqual(exp_32.value.shape, (1092,))
+        np.testing.assert_allclose(exp_32.value.values, exp.value.values, rtol=1e-6)
+
     def test_set_to_usd(self):
         """Test calculating crop_production Exposure in [USD / y]"""
         exp = CropProduction()
@@ -46,3 +46,19 @@ class IFRelativeCropyield(ImpactFunc):
         self.mdr = (self.intensity)
         self.mdd = (self.intensity)
         self.paa = np.ones(len(self.intensity))
+
+    def calc_mdr(self, inten):
+        """Interpolate impact function to a given intensity. If the percentage
+        of affected assets is constant (as set by set_relativeyield), only the
+        mean damage degree needs to be interpolated.
+
+        Parameters:
+            inten (float or np.array): intensity, the x-coordinate of the
+                interpolated values.
+
+        Returns:
+            np.array
+        """
+        if np.all(self.paa == self.paa[0]):
+            return self.paa[0] * np.interp(inten, self.intensity, self.mdd)
+        return ImpactFunc.calc_mdr(self, inten)
@@ -580,12 +580,14 @@ class Hazard():
         # filter events based on name
         sel_ev = np.argwhere(sel_ev).reshape(-1)
         if isinstance(event_names, list):
-            filtered_events = [self.event_name[i] for i in sel_ev]
+            # position of the first event with each name among the filtered events
+            name_pos = dict()
+            for pos, i_ev in enumerate(sel_ev):
+                name_pos.setdefault(self.event_name[i_ev], pos)
             try:
-                new_sel = [filtered_events.index(n) for n in event_names]
-            except ValueError as err:
-                name = str(err).replace(" is not in list", "")
-                LOGGER.info('No hazard with name %s', name)
+                new_sel = [name_pos[n] for n in event_names]
+            except KeyError as err:
+                LOGGER.info('No hazard with name %s', str(err))
                 return None
             sel_ev = sel_ev[new_sel]
 
@@ -485,18 +485,27 @@ class Centroids():
             close_idx = self.geometry.distance(Point(x_lon, y_lat)).values.argmin()
         return self.lon[close_idx], self.lat[close_idx], close_idx
 
-    def set_region_id(self, scheduler=None):
+    def set_region_id(self, scheduler=None, gridded=False):
         """Set region_id as country ISO numeric code attribute for every pixel
         or point
 
         Parameters:
             scheduler (str): used for dask map_partitions. “threads”,
                 “synchronous” or “processes”
+            gridded (bool): If True, look up the region_id in the precomputed
+                gridded Natural Earth data (150 arc-seconds) instead of testing
+                every point against the country shapes. Much faster for many
+                centroids, but less precise close to borders. Default: False.
         """
-        ne_geom = self._ne_crs_geom(scheduler)
+        if gridded and self.crs and equal_crs(self.crs, NE_CRS):
+            if not self.lat.size or not self.lon.size:
+                self.set_meta_to_lat_lon()
+            lat, lon = self.lat, self.lon
+        else:
+            ne_geom = self._ne_crs_geom(scheduler)
+            lat, lon = ne_geom.geometry[:].y.values, ne_geom.geometry[:].x.values
         LOGGER.debug('Setting region_id %s points.', str(self.lat.size))
-        self.region_id = get_country_code(ne_geom.geometry[:].y.values,
-                                          ne_geom.geometry[:].x.values)
+        self.region_id = get_country_code(lat, lon, gridded=gridded)
 
     def set_area_pixel(self, min_resol=1.0e-8, scheduler=None):
         """Set area_pixel attribute for every pixel or point. area in m*m
@@ -192,6 +192,13 @@ class TestVector(unittest.TestCase):
         self.assertEqual(np.count_nonzero(centr.region_id), 6)
         self.assertEqual(centr.region_id[0], 52)  # 052 for barbados
 
+    def test_region_id_gridded_pass(self):
+        """Test set_region_id with gridded data"""
+        centr = Centroids()
+        centr.set_lat_lon(np.array([46.95, 40.42, 0]), np.array([7.45, -3.70, -30]))
+        centr.set_region_id(gridded=True)
+        self.assertTrue(np.array_equal(centr.region_id, np.array([756, 724, 0])))
+
     def test_on_land(self):
         """Test set_on_land"""
         centr = Centroids()
@@ -102,7 +102,8 @@ class RelativeCropyield(Hazard):
     def set_from_single_run(self, input_dir=None, filename=None, bbox=BBOX,
                             yearrange=(YEARCHUNKS['historical'])['yearrange'],
                             ag_model=None, cl_model=None, scenario='historical',
-                            soc=None, co2=None, crop=None, irr=None, fn_str_var=FN_STR_VAR):
+                            soc=None, co2=None, crop=None, irr=None, fn_str_var=FN_STR_VAR,
+                            dtype=None):
 
         """Wrapper to fill hazard from nc_dis file from ISIMIP
         Parameters:
@@ -126,6 +127,8 @@ class RelativeCropyield(Hazard):
                 f.i 'noirr' or 'irr'
             fn_str_var (str): FileName STRing depending on VARiable and
                 ISIMIP simuation round
+            dtype (numpy dtype, optional): data type of the intensity, f.i.
+                np.float32 to halve its memory. Default: as read from file
         raises:
             NameError
         """
@@ -181,6 +184,8 @@ class RelativeCropyield(Hazard):
         self.set_raster([filename], band=id_bands,
                         geometry=list([shapely.geometry.box(lonmin, latmin, lonmax, latmax)]))
 
+        if dtype is not None:
+            self.intensity = self.intensity.astype(dtype, copy=False)
         self.intensity.data[np.isnan(self.intensity.data)] = 0.0
         self.intensity.todense()
         self.crop = crop
@@ -54,6 +54,24 @@ class TestRelativeCropyield(unittest.TestCase):
         self.assertEqual(haz.event_id.size, 5)
         self.assertAlmostEqual(haz.intensity.max(), 10.176164, places=5)
 
+    def test_load_dtype_pass(self):
+        """Test defining crop potential hazard with float32 intensity"""
+        haz = RelativeCropyield()
+        haz.set_from_single_run(input_dir=INPUT_DIR, yearrange=(2001, 2005), ag_model='lpjml',
+                                cl_model='ipsl-cm5a-lr', scenario='historical', soc='2005soc',
+                                co2='co2', crop='whe', irr='noirr', fn_str_var=FN_STR_DEMO)
+        haz_32 = RelativeCropyield()
+        haz_32.set_from_single_run(input_dir=INPUT_DIR, yearrange=(2001, 2005), ag_model='lpjml',
+                                   cl_model='ipsl-cm5a-lr', scenario='historical', soc='2005soc',
+                                   co2='co2', crop='whe', irr='noirr', fn_str_var=FN_STR_DEMO,
+                                   dtype=np.float32)
+
+        self.assertEqual(haz_32.intensity.dtype, np.float32)
+        self.assertEqual(haz_32.fraction.dtype, np.float32)
+        self.assertEqual(haz_32.intensity.shape, (5, 1092))
+        np.testing.assert_allclose(haz_32.intensity.toarray(), haz.intensity.toarray(),
+                                   rtol=1e-6)
+
     def test_set_rel_yield(self):
         """Test setting intensity to relativ yield"""
         haz = RelativeCropyield()
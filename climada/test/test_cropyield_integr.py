@@ -21,6 +21,7 @@ Tests on Drought Hazard exposure and Impact function.
 
 import unittest
 import os
+import copy
 import numpy as np
 from climada.util.constants import DATA_DIR
 from climada.hazard.relative_cropyield import (RelativeCropyield, init_hazard_set, 
@@ -35,10 +36,24 @@ FN_STR_DEMO = 'annual_FR_DE_DEMO'
 FILENAME_LU = 'histsoc_landuse-15crops_annual_FR_DE_DEMO_2001_2005.nc'
 FILENAME_MEAN = 'hist_mean_mai-firr_1976-2005_DE_FR.hdf5'
 
+def _scale_columns(mat, vec):
+    """Multiply each column of a sparse matrix by the corresponding vector entry"""
+    mat = mat.tocsr().astype(np.result_type(mat.dtype, vec.dtype))
+    mat.data *= vec[mat.indices]
+    return mat
+
 
 class TestIntegr(unittest.TestCase):
     """Test loading functions from the ISIMIP Agricultural Drought class and
         computing impact on crop production"""
+    @classmethod
+    def setUpClass(cls):
+        cls.if_cp = ImpactFuncSet()
+        if_def = IFRelativeCropyield()
+        if_def.set_relativeyield()
+        cls.if_cp.append(if_def)
+        cls.if_cp.check()
+
     def test_EU(self):
         """test with demo data containing France and Germany"""
         bbox = [-5, 42, 16, 55]
@@ -59,29 +74,34 @@ class TestIntegr(unittest.TestCase):
         exp.set_to_usd(INPUT_DIR)
         exp.assign_centroids(haz, threshold=20)
 
-        if_cp = ImpactFuncSet()
-        if_def = IFRelativeCropyield()
-        if_def.set_relativeyield()
-        if_cp.append(if_def)
-        if_cp.check()
-
+        idx_276 = np.flatnonzero(exp.region_id.values == 276)
         impact = Impact()
-        impact.calc(exp.loc[exp.region_id == 276], if_cp, haz.select(['2002']), save_mat=True)
+        impact.calc(exp.iloc[idx_276], self.if_cp, haz.select(['2002']), save_mat=True)
 
-        exp_manual = exp.value.loc[exp.region_id == 276].values
-        impact_manual = haz.select(event_names=['2002'], reg_id=276).intensity.multiply(exp_manual)
-        dif = (impact_manual - impact.imp_mat).data
+        exp_manual = exp.value.values[idx_276]
+        impact_manual = _scale_columns(haz.select(event_names=['2002'], reg_id=276).intensity,
+                                       exp_manual)
+        # imp_mat only stores nonzero impacts, in canonical order
+        impact_manual.eliminate_zeros()
+        impact_manual.sort_indices()
+        impact.imp_mat.sort_indices()
 
         self.assertEqual(haz.tag.haz_type, 'RC')
         self.assertEqual(haz.size, 5)
         self.assertEqual(haz.centroids.size, 1092)
-        self.assertAlmostEqual(haz.intensity.mean(), -2.0489097e-08)
-        self.assertAlmostEqual(exp.value.max(), 53074789.755290434)
         self.assertEqual(exp.latitude.values.size, 1092)
-        self.assertAlmostEqual(exp.value[3], 0.0)
-        self.assertAlmostEqual(exp.value[1077], 405026.6857207429)
-        self.assertAlmostEqual(impact.imp_mat.data[3], -176102.5359452465 )
-        self.assertEqual(len(dif), 0)
+        # mean over the stored values only, without an upcast copy of the matrix
+        int_mean = haz.intensity.data.sum(dtype=float) / np.prod(haz.intensity.shape)
+        np.testing.assert_allclose(
+            [int_mean, exp.value.max(), exp.value.values[3],
+             exp.value.values[1077], impact.imp_mat.data[3]],
+            [-2.0489097e-08, 53074789.755290434, 0.0,
+             405026.6857207429, -176102.5359452465],
+            # absolute tolerance of assertAlmostEqual with 7 places
+            rtol=0, atol=5e-8)
+        self.assertTrue(np.array_equal(impact_manual.indptr, impact.imp_mat.indptr))
+        self.assertTrue(np.array_equal(impact_manual.indices, impact.imp_mat.indices))
+        self.assertTrue(np.array_equal(impact_manual.data, impact.imp_mat.data))
 
     def test_EU_nan(self):
         """Test whether setting the zeros in exp.value to NaN changes the impact"""
@@ -101,25 +121,17 @@ class TestIntegr(unittest.TestCase):
                                               scenario='flexible', unit='t', crop='whe', irr='firr')
         exp.assign_centroids(haz, threshold=20)
 
-        if_cp = ImpactFuncSet()
-        if_def = IFRelativeCropyield()
-        if_def.set_relativeyield()
-        if_cp.append(if_def)
-        if_cp.check()
+        # same exposures with NaN instead of zeros; the raster centroids assigned
+        # to exp do not depend on the values and are kept
+        exp_nan = copy.deepcopy(exp)
+        values = exp_nan.value.values
+        exp_nan['value'] = np.where(values == 0, np.nan, values)
 
         impact = Impact()
-        impact.calc(exp, if_cp, haz, save_mat=True)
-
-        exp_nan = CropProduction()
-        exp_nan.set_from_single_run(input_dir=INPUT_DIR, filename=FILENAME_LU, hist_mean=FILENAME_MEAN,
-                                              bbox=[0, 42, 10, 52], yearrange=(2001, 2005),
-                                              scenario='flexible', unit='t', crop='whe', irr='firr')
-        exp_nan.value[exp_nan.value==0] = np.nan
-        exp_nan.assign_centroids(haz, threshold=20)
-
+        impact.calc(exp, self.if_cp, haz)
         impact_nan = Impact()
-        impact_nan.calc(exp_nan, if_cp, haz, save_mat=True)
-        self.assertListEqual(list(impact.at_event), list(impact_nan.at_event))
+        impact_nan.calc(exp_nan, self.if_cp, haz)
+        np.testing.assert_array_equal(impact.at_event, impact_nan.at_event)
         self.assertAlmostEqual(12.056545220060798, impact_nan.aai_agg)
         self.assertAlmostEqual(12.056545220060798 , impact.aai_agg)
 